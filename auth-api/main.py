@@ -1,11 +1,19 @@
 import os
+import sys
 import json
-from fastapi import FastAPI, HTTPException, Depends, Query, status
-from fastapi.security import OAuth2PasswordBearer
-from pydantic import BaseModel
-import boto3
-from botocore.exceptions import ClientError
-from jose import JWTError, jwt
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+from fastapi import FastAPI, Header, HTTPException, Depends, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from passlib.context import CryptContext
+import aioboto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+import jwt
+from jwt import InvalidTokenError
 
 # --- 1. CONFIGURAÇÃO E CLIENTE DYNAMODB ---
 
@@ -13,29 +21,105 @@ from jose import JWTError, jwt
 DYNAMODB_ENDPOINT = os.getenv("DYNAMODB_ENDPOINT", "http://localhost:8000")
 REGION = os.getenv("AWS_REGION", "us-west-2")
 
-# Configuração simulada para o DynamoDB Local
-dynamodb = boto3.resource(
-	'dynamodb',
-	endpoint_url=DYNAMODB_ENDPOINT,
-	region_name=REGION,
-	aws_access_key_id='local',
-	aws_secret_access_key='local'
+# Pool de conexões HTTP maior, keep-alive de TCP e retries adaptativos para
+# suportar a concorrência do FastAPI sem refazer handshakes por requisição
+BOTO_CONFIG = Config(
+	max_pool_connections=50,
+	connect_timeout=5,
+	read_timeout=10,
+	tcp_keepalive=True,
+	retries={'mode': 'adaptive', 'total_max_attempts': 3}
 )
-# Referência às tabelas de configuração
-users_table = dynamodb.Table('users')
-roles_table = dynamodb.Table('roles')
 
-app = FastAPI(title="DynamoDB Auth Proxy API")
+# Sessão aioboto3 compartilhada; o resource assíncrono é aberto no lifespan
+session = aioboto3.Session()
+
+# Preenchidos no lifespan, antes da aplicação receber tráfego
+dynamodb = None
+users_table = None
+roles_table = None
+_tables: dict = {} # table_name -> handle de Table compartilhado
+
+async def get_table(table_name: str):
+	"""
+	Retorna um handle compartilhado de Table por nome.
+
+	dynamodb.Table() aloca um novo objeto de recurso a cada chamada; como o
+	conjunto de tabelas é pequeno e fixo, os handles são cacheados e
+	reutilizados por todas as requisições.
+	"""
+	table = _tables.get(table_name)
+	if table is None:
+		table = await dynamodb.Table(table_name)
+		_tables[table_name] = table
+	return table
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	"""
+	Abre o resource assíncrono do DynamoDB antes de aceitar tráfego e o encerra
+	junto com a aplicação. Todas as requisições compartilham o mesmo pool de
+	conexões, sem bloquear o event loop durante as chamadas ao banco.
+	"""
+	global dynamodb, users_table, roles_table
+	async with session.resource(
+		'dynamodb',
+		endpoint_url=DYNAMODB_ENDPOINT,
+		region_name=REGION,
+		aws_access_key_id='local',
+		aws_secret_access_key='local',
+		config=BOTO_CONFIG
+	) as resource:
+		dynamodb = resource
+		# Referência às tabelas de configuração
+		users_table = await get_table('users')
+		roles_table = await get_table('roles')
+
+		# Pré-aquece a conexão e o cache de papéis: a tabela 'roles' é pequena,
+		# então um scan único deixa as checagens de permissão quentes desde a
+		# primeira requisição (e paga o handshake TCP antes de chegar tráfego)
+		try:
+			now = time.monotonic()
+			scan_kwargs = {}
+			while True:
+				# Segue LastEvaluatedKey e compila cada página assim que chega,
+				# sem materializar a lista completa de itens em memória
+				page = await roles_table.scan(**scan_kwargs)
+				for role_item in page.get('Items', []):
+					_cache_role_item(role_item, now)
+				last_key = page.get('LastEvaluatedKey')
+				if not last_key:
+					break
+				scan_kwargs['ExclusiveStartKey'] = last_key
+		except (ClientError, BotoCoreError) as e:
+			# Não é fatal (inclui o banco ainda subindo, ex.: EndpointConnectionError):
+			# o cache se preenche sob demanda na primeira requisição
+			print(f"Aviso: pré-aquecimento do cache de papéis falhou: {e}")
+
+		yield
+	_tables.clear()
+
+# ORJSONResponse serializa as respostas com orjson (escritor JSON em C),
+# várias vezes mais rápido que o json da stdlib usado pelo JSONResponse padrão
+app = FastAPI(title="DynamoDB Auth Proxy API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # --- 2. CONFIGURAÇÃO JWT ---
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "seu-segredo-super-secreto")
 ALGORITHM = "HS256"
-# Define o esquema OAuth2 e o endpoint onde o token deve ser obtido
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
+# Contexto de hashing de senhas: o verify do argon2 roda em C (argon2-cffi) e em
+# tempo constante, sem o curto-circuito do '!=' entre strings
+pwd_ctx = CryptContext(schemes=["argon2"], deprecated="auto")
+# Validade do token em segundos; também limita a vida das entradas do cache de decode
+ACCESS_TOKEN_TTL = int(os.getenv("ACCESS_TOKEN_TTL", "3600"))
+# Cache de decodificação: o mesmo bearer token se repete em muitas requisições
+# do mesmo cliente, então o HMAC + parse JSON só precisa rodar uma vez por token.
+TOKEN_CACHE_MAX = 10000
+_token_cache: dict = {} # token -> (timestamp de expiração, UserToken)
 
 def create_access_token(data: dict):
-	""" 
+	"""
 	Cria um token JWT (JSON Web Token) assinado contendo os dados do usuário.
+	O claim 'exp' é preenchido com ACCESS_TOKEN_TTL segundos a partir de agora.
 
 	Args:
 		data (dict): Payload a ser codificado (ex: {"sub": "username", "role": ["role_name"]}).
@@ -44,6 +128,7 @@ def create_access_token(data: dict):
 		str: O token JWT codificado.
 	"""
 	to_encode = data.copy()
+	to_encode["exp"] = int(time.time()) + ACCESS_TOKEN_TTL
 	return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 # --- 3. MODELOS Pydantic (Para validação de dados) ---
@@ -51,32 +136,166 @@ class UserLogin(BaseModel):
 	"""
 	Modelo para dados de login de usuário.
 	"""
+	model_config = ConfigDict(extra='forbid')
+
 	username: str
-	password: str # NOTE:: Senhas em texto puro!
+	password: str # Texto puro apenas no transporte; armazenada como hash argon2
 
 class UserToken(BaseModel):
 	"""
 	Modelo interno para representar o usuário autenticado, extraído do JWT.
+	Imutável (frozen): as instâncias são compartilhadas pelo cache de tokens.
 	"""
+	model_config = ConfigDict(frozen=True)
+
 	username: str
-	role_name: str
+	role_names: list # Todos os papéis do claim 'role'
 
 class DynamoDBRequest(BaseModel):
 	"""
 	Modelo para as requisições de escrita/atualização no proxy.
+
+	Os valores ficam como Any de propósito: o proxy é genérico e o DynamoDB
+	aceita atributos aninhados (mapas, listas, conjuntos) que uma união de
+	escalares rejeitaria com 422.
 	"""
-	key: dict # A chave primária (ex: {"customer_name": "Bob"})
-	attributes: dict = {} # Os atributos do item a serem inseridos ou atualizados
+	model_config = ConfigDict(extra='forbid')
+
+	key: dict[str, Any] # A chave primária (ex: {"customer_name": "Bob"})
+	attributes: dict[str, Any] = {} # Os atributos do item a serem inseridos ou atualizados
 	
 # --- 4. LÓGICA DE AUTORIZAÇÃO ---
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserToken:
-	""" 
-	Decodifica e valida o JWT para extrair o usuário e o papel. 
+class RolePermissions:
+	"""
+	Permissões de um papel pré-compiladas no carregamento.
+
+	Separa uma única vez o coringa global ('*'), os coringas por tabela
+	('tabela:*') e as permissões exatas, de modo que a checagem por requisição
+	se reduza a uma ou duas buscas em hash.
+	"""
+	__slots__ = ('global_star', 'wildcard_tables', 'exact')
+
+	def __init__(self, raw_permissions):
+		exact = frozenset(raw_permissions)
+		self.global_star = '*' in exact
+		self.wildcard_tables = frozenset(p[:-2] for p in exact if p.endswith(':*'))
+		self.exact = exact
+
+	def allows(self, table_name: str, permission_string: str) -> bool:
+		""" Testa se o papel autoriza a permissão (exata ou via coringa de tabela). """
+		if self.global_star:
+			return True
+		if permission_string in self.exact:
+			return True
+		return table_name in self.wildcard_tables
+
+# Cache em memória de papel -> permissões. Papéis mudam raramente, então um TTL
+# curto elimina uma ida ao DynamoDB em praticamente toda requisição autorizada.
+ROLE_CACHE_TTL = 30.0 # segundos
+_role_cache: dict = {} # role_name -> (timestamp, RolePermissions)
+
+def _cache_role_item(role_item: dict, now: float) -> RolePermissions:
+	""" Compila um item da tabela 'roles' e o registra no cache; retorna o matcher. """
+	# StringSet chega como set; papéis antigos gravados como lista seguem aceitos
+	raw_permissions = role_item.get('permissions') or ()
+	if not isinstance(raw_permissions, (list, set, frozenset)):
+		raw_permissions = ()
+	permissions = RolePermissions(raw_permissions)
+	_role_cache[role_item['role_name']] = (now, permissions)
+	return permissions
+
+@lru_cache(maxsize=256)
+def _permission_key(table_name: str, permission_suffix: str) -> str:
+	"""
+	Memoiza a string de permissão '{tabela}{sufixo}' para pares já vistos.
+
+	O espaço de (tabela, ação) é pequeno e fixo, então depois do aquecimento a
+	montagem vira uma busca em dict; sys.intern deixa as comparações de igualdade
+	no matcher em nível de ponteiro.
+	"""
+	return sys.intern(table_name + permission_suffix)
+
+def invalidate_role_cache(role_name: str = None):
+	"""
+	Remove um papel (ou todos, se role_name for None) do cache de permissões.
+	Chamado quando a tabela 'roles' é alterada via proxy, para que a mudança
+	tenha efeito imediato em vez de esperar o TTL expirar.
+	"""
+	if role_name is None:
+		_role_cache.clear()
+	else:
+		_role_cache.pop(role_name, None)
+
+async def get_permissions_for_roles(role_names: list) -> tuple:
+	"""
+	Busca as permissões de uma lista de papéis na tabela 'roles', já compiladas
+	em objetos RolePermissions.
+
+	Os papéis resolvidos ficam em um cache TTL em memória; só os papéis fora do
+	cache vão ao DynamoDB. Um único papel usa um GetItem direto; vários papéis
+	usam um único BatchGetItem (até 100 chaves por chamada).
+
+	Args:
+		role_names (list): Nomes dos papéis a consultar.
+
+	Raises:
+		HTTPException: 403 FORBIDDEN se nenhum dos papéis for encontrado.
+
+	Returns:
+		tuple: Um RolePermissions por papel encontrado.
+	"""
+	now = time.monotonic()
+	resolved = {}
+	missing = []
+	for role_name in role_names:
+		entry = _role_cache.get(role_name)
+		if entry is not None and now - entry[0] < ROLE_CACHE_TTL:
+			resolved[role_name] = entry[1]
+		else:
+			missing.append(role_name)
+
+	if missing:
+		# Projeta apenas os atributos usados: menos bytes por resposta no caminho
+		# quente ('permissions' via alias, por ser palavra reservada do DynamoDB)
+		if len(missing) == 1:
+			# Caminho comum: um papel só, sem o overhead do batch
+			response = await roles_table.get_item(
+				Key={'role_name': missing[0]},
+				ProjectionExpression='role_name, #p',
+				ExpressionAttributeNames={'#p': 'permissions'}
+			)
+			role_items = [response['Item']] if 'Item' in response else []
+		else:
+			role_items = []
+			request_items = {'roles': {
+				'Keys': [{'role_name': name} for name in missing],
+				'ProjectionExpression': 'role_name, #p',
+				'ExpressionAttributeNames': {'#p': 'permissions'}
+			}}
+			# Reemite as chaves não processadas até esvaziar (laço padrão do BatchGetItem)
+			while request_items:
+				response = await dynamodb.batch_get_item(RequestItems=request_items)
+				role_items.extend(response.get('Responses', {}).get('roles', []))
+				request_items = response.get('UnprocessedKeys') or None
+
+		for role_item in role_items:
+			# Compila o matcher uma única vez, no carregamento do papel
+			resolved[role_item['role_name']] = _cache_role_item(role_item, now)
+
+	if not resolved:
+		raise HTTPException(status_code=403, detail=f"Papel '{', '.join(role_names)}' não encontrado.")
+
+	return tuple(resolved.values())
+
+async def get_current_user(authorization: str = Header(None)) -> UserToken:
+	"""
+	Extrai o bearer token do cabeçalho Authorization, decodifica e valida o JWT
+	para obter o usuário e os papéis.
 	Usado como dependência de autenticação para proteger endpoints.
 
 	Args:
-		token (str): O JWT do cabeçalho Authorization: Bearer.
+		authorization (str): Cabeçalho 'Authorization: Bearer <token>'.
 
 	Raises:
 		HTTPException: 401 UNAUTHORIZED se o token for inválido, expirado ou não contiver um papel válido.
@@ -89,42 +308,59 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserToken:
 		detail="Credenciais inválidas ou token expirado",
 		headers={"WWW-Authenticate": "Bearer"},
 	)
+
+	# Extração manual do bearer: dispensa o OAuth2PasswordBearer e sua camada
+	# de parsing do Starlette em cada requisição
+	if not authorization:
+		raise credentials_exception
+	scheme, _, token = authorization.partition(' ')
+	if scheme.lower() != 'bearer' or not token:
+		raise credentials_exception
+
+	# Cache primeiro: evita repetir o verify HMAC para um token já conhecido
+	cached = _token_cache.get(token)
+	if cached is not None:
+		if time.time() < cached[0]:
+			return cached[1]
+		_token_cache.pop(token, None)
+
 	try:
 		# Decodifica o token
 		payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 		username: str = payload.get("sub")
 		role_data: str = payload.get("role")
-		
-		# Garante que role_name é uma string única
-		role_name: str
+
+		# Normaliza o claim em uma lista com todos os papéis do usuário
+		role_names: list
 		if isinstance(role_data, list) and role_data:
-			role_name = role_data[0] # TODO:: Pega o primeiro papel apenas
+			role_names = role_data
 		elif isinstance(role_data, str):
-			role_name = role_data
+			role_names = [role_data]
 		else:
 			raise credentials_exception # Não encontrou um papel válido
 
 		if username is None:
 			raise credentials_exception
-			
-		return UserToken(username=username, role_name=role_name)
-	except JWTError:
+
+		user = UserToken(username=username, role_names=role_names)
+		# Limite simples de tamanho; tokens legados sem 'exp' expiram junto com o TTL
+		if len(_token_cache) >= TOKEN_CACHE_MAX:
+			_token_cache.clear()
+		_token_cache[token] = (payload.get("exp", time.time() + ACCESS_TOKEN_TTL), user)
+		return user
+	except InvalidTokenError:
 		# Captura erros de assinatura, expiração, etc.
 		raise credentials_exception
 
-async def check_permission(
-	user: UserToken = Depends(get_current_user), 
-	table_name: str = "default", 
-	action: str = "read"
-):
-	""" 
-	Verifica se o papel do usuário tem permissão para a ação ('read', 'write', etc.) na tabela.
+async def check_permission(user: UserToken, table_name: str, permission_suffix: str):
+	"""
+	Verifica se o papel do usuário tem permissão para a ação na tabela.
 	Esta é a função central de Autorização (RBAC).
 
 	Args:
-		user (UserToken): Usuário e papel autenticados (obtido via Depends).
+		user (UserToken): Usuário e papel autenticados.
 		table_name (str): Nome da tabela alvo (ex: 'customer', 'users').
-		action (str): Ação desejada (ex: 'read', 'write', 'delete').
+		permission_suffix (str): Sufixo ':acao' pré-montado por require().
 
 	Raises:
 		HTTPException: 403 FORBIDDEN se a permissão não for encontrada para o papel.
@@ -132,28 +368,22 @@ async def check_permission(
 	Returns:
 		bool: True se a permissão for concedida.
 	"""
-	permission_string = f"{table_name}:{action}"
-	role_name = user.role_name
-
-	# 1. Busca as permissões do papel no DynamoDB
+	# 1. Busca os matchers de todos os papéis do usuário (batch quando há vários)
 	try:
-		response = roles_table.get_item(Key={'role_name': role_name})
-		role_item = response.get('Item')
-
-		if not role_item:
-			raise HTTPException(status_code=403, detail=f"Papel '{role_name}' não encontrado.")
+		matchers = await get_permissions_for_roles(user.role_names)
 
-		# O Boto3 Resource geralmente deserializa o tipo 'L' do DynamoDB para uma lista Python.
-		permissions = role_item.get('permissions', [])
-
-		if not isinstance(permissions, list):
-			permissions = []
+		# 2. Coringa global primeiro: é o caminho comum dos papéis privilegiados
+		# e evita montar a string de permissão quando ela não é necessária
+		if any(matcher.global_star for matcher in matchers):
+			return True
 
-		# 2. Verifica a permissão (Coringa ou Permissão Específica)
-		if "*" in permissions or permission_string in permissions:
+		# 3. Permissão específica ou coringa de tabela; a string é memoizada
+		# por (tabela, sufixo), então pares já vistos não alocam nada
+		permission_string = _permission_key(table_name, permission_suffix)
+		if any(matcher.allows(table_name, permission_string) for matcher in matchers):
 			return True
-		
-		# 3. Não Autorizado
+
+		# 4. Não Autorizado
 		raise HTTPException(
 			status_code=403,
 			detail=f"Usuário não autorizado: Necessária permissão '{permission_string}'."
@@ -164,37 +394,59 @@ async def check_permission(
 		print(f"Erro ao buscar permissões: {e}")
 		raise HTTPException(status_code=500, detail="Erro interno de autorização.")
 
-# --- Funções Auxiliares de Autorização (Dependências) ---
-async def authorize_read(table_name: str, current_user: UserToken = Depends(get_current_user)):
-	""" Dependência para verificar permissão de 'read' em uma tabela específica. """
-	return await check_permission(user=current_user, table_name=table_name, action="read")
+# --- Dependências de Autorização ---
+class RequirePermission:
+	"""
+	Dependência de autorização parametrizada pela ação.
 
-async def authorize_write(table_name: str, current_user: UserToken = Depends(get_current_user)):
-	""" Dependência para verificar permissão de 'write' em uma tabela específica. """
-	return await check_permission(user=current_user, table_name=table_name, action="write")
+	Uma instância por ação substitui as quatro corrotinas authorize_* quase
+	idênticas. Como __call__ é async, o FastAPI a executa direto no event loop,
+	sem despachar para o threadpool reservado a dependências síncronas. O sufixo
+	constante da string de permissão (':read', ':write', ...) é montado uma
+	única vez na construção, e não a cada requisição.
+
+	__call__ devolve o próprio UserToken autenticado: o endpoint recebe o
+	usuário e a autorização em um único nó de dependência, sem resolver
+	get_current_user uma segunda vez.
+	"""
+	def __init__(self, action: str):
+		self.action = action
+		self.permission_suffix = f":{action}"
 
-async def authorize_delete(table_name: str, current_user: UserToken = Depends(get_current_user)):
-	""" Dependência para verificar permissão de 'delete' em uma tabela específica. """
-	return await check_permission(user=current_user, table_name=table_name, action="delete")
+	async def __call__(self, table_name: str, current_user: UserToken = Depends(get_current_user)) -> UserToken:
+		await check_permission(current_user, table_name, self.permission_suffix)
+		return current_user
 
-async def authorize_update(table_name: str, current_user: UserToken = Depends(get_current_user)):
-	""" Dependência para verificar permissão de 'update' em uma tabela específica. """
-	return await check_permission(user=current_user, table_name=table_name, action="update")
+authorize_read = RequirePermission("read")
+authorize_write = RequirePermission("write")
+authorize_delete = RequirePermission("delete")
+authorize_update = RequirePermission("update")
 
 # --- 5. ENDPOINTS DE AUTENTICAÇÃO E TESTE ---
 
 @app.post("/login", summary="Autenticação e Geração de Token JWT")
 async def login_for_access_token(form_data: UserLogin):
 	"""
-	Verifica as credenciais do usuário na tabela 'users' (simulação de hash com senha em texto puro)
-	e retorna um JWT contendo o papel do usuário.
+	Verifica as credenciais do usuário na tabela 'users' (hash argon2 armazenado
+	em 'password_hash') e retorna um JWT contendo o papel do usuário.
 	"""
 	try:
-		response = users_table.get_item(Key={'username': form_data.username})
+		# Busca só o necessário para autenticar
+		response = await users_table.get_item(
+			Key={'username': form_data.username},
+			ProjectionExpression='username, password_hash, role_name'
+		)
 		user_item = response.get('Item')
 
-		# Verifica se o usuário existe e se a senha coincide
-		if not user_item or user_item.get('password') != form_data.password:
+		# Verifica se o usuário existe e se a senha confere com o hash armazenado
+		password_hash = user_item.get('password_hash') if user_item else None
+		try:
+			password_ok = bool(password_hash) and pwd_ctx.verify(form_data.password, password_hash)
+		except ValueError:
+			# Hash ilegível (UnknownHashError e afins, ex.: item gravado via proxy
+			# com valor inválido): conta como senha incorreta, não como erro 500
+			password_ok = False
+		if not password_ok:
 			raise HTTPException(
 				status_code=status.HTTP_401_UNAUTHORIZED,
 				detail="Nome de usuário ou senha inválidos",
@@ -215,29 +467,35 @@ async def login_for_access_token(form_data: UserLogin):
 
 @app.get("/users/me", summary="Testa o Token e Retorna Informações do Usuário")
 async def read_users_me(current_user: UserToken = Depends(get_current_user)):
-	return {"username": current_user.username, "role": current_user.role_name}
+	return {"username": current_user.username, "role": current_user.role_names}
 
 # --- 6. ENDPOINTS DE PROXY DO DYNAMODB (COM AUTORIZAÇÃO) ---
 
 @app.get("/api/{table_name}/item", summary="Proxy para GetItem/Read (Consulta Autorizada)")
 async def get_item_proxy(
-	table_name: str, 
-	key: str, 
+	table_name: str,
+	key: str,
 	key_value: str,
-	# Chama a dependência para verificar permissão de 'read'
-	authorized: bool = Depends(authorize_read) 
+	consistent: bool = False,
+	# Autentica e autoriza 'read' em um único nó de dependência
+	user: UserToken = Depends(authorize_read)
 ):
 	"""
 	Executa um GetItem no DynamoDB APENAS se o usuário tiver permissão '{tabela}:read'.
-	
+
+	Por padrão usa leitura eventualmente consistente (metade do custo/latência de
+	uma leitura forte); passe ?consistent=true quando precisar ler uma escrita
+	recém-feita.
+
 	Args:
 		table_name (str): Tabela alvo.
 		key (str): Nome da chave primária.
 		key_value (str): Valor da chave primária.
+		consistent (bool): Se True, usa leitura fortemente consistente.
 	"""
 	try:
-		table = dynamodb.Table(table_name)
-		response = table.get_item(Key={key: key_value})
+		table = await get_table(table_name)
+		response = await table.get_item(Key={key: key_value}, ConsistentRead=consistent)
 		
 		if 'Item' not in response:
 			raise HTTPException(status_code=404, detail=f"Item não encontrado na tabela {table_name}.")
@@ -252,8 +510,8 @@ async def get_item_proxy(
 async def put_item_proxy(
 	table_name: str,
 	request: DynamoDBRequest,
-	# Chama a dependência para verificar permissão de 'write'
-	authorized: bool = Depends(authorize_write) 
+	# Autentica e autoriza 'write' em um único nó de dependência
+	user: UserToken = Depends(authorize_write) 
 ):
 	"""
 	Executa um PutItem (criação/sobrescrita) no DynamoDB APENAS se o usuário tiver permissão '{tabela}:write'.
@@ -263,13 +521,18 @@ async def put_item_proxy(
 		request (DynamoDBRequest): Corpo da requisição contendo key e attributes.
 	"""
 	try:
-		table = dynamodb.Table(table_name)
+		table = await get_table(table_name)
 		
 		# Combina a chave e os atributos
 		item_to_put = request.key.copy()
 		item_to_put.update(request.attributes)
 		
-		table.put_item(Item=item_to_put)
+		await table.put_item(Item=item_to_put)
+
+		# Escritas na tabela 'roles' invalidam o cache do papel alterado
+		if table_name == 'roles':
+			invalidate_role_cache(request.key.get('role_name'))
+
 		return {"message": f"Item inserido/atualizado com sucesso na tabela {table_name}"}
 
 	except ClientError as e:
@@ -279,8 +542,8 @@ async def put_item_proxy(
 async def update_item_proxy(
 	table_name: str,
 	request: DynamoDBRequest,
-	# Chama a dependência para verificar permissão de 'update'
-	authorized: bool = Depends(authorize_update) 
+	# Autentica e autoriza 'update' em um único nó de dependência
+	user: UserToken = Depends(authorize_update) 
 ):
 	"""
 	Executa um PutItem (sobrescrita total) no DynamoDB APENAS se o usuário tiver permissão '{tabela}:update'.
@@ -290,14 +553,19 @@ async def update_item_proxy(
 		request (DynamoDBRequest): Corpo da requisição contendo key e attributes.
 	"""
 	try:
-		table = dynamodb.Table(table_name)
+		table = await get_table(table_name)
 		
 		# Combina a chave e os atributos para sobrescrever o item
 		item_to_put = request.key.copy()
 		item_to_put.update(request.attributes)
 		
 		# Usa put_item para sobrescrever o item existente
-		table.put_item(Item=item_to_put)
+		await table.put_item(Item=item_to_put)
+
+		# Escritas na tabela 'roles' invalidam o cache do papel alterado
+		if table_name == 'roles':
+			invalidate_role_cache(request.key.get('role_name'))
+
 		return {"message": f"Item atualizado/sobrescrito com sucesso na tabela {table_name}"}
 
 	except ClientError as e:
@@ -308,8 +576,8 @@ async def delete_item_proxy(
 	table_name: str,
 	key: str, 
 	key_value: str,
-	# Chama a dependência para verificar permissão de 'delete'
-	authorized: bool = Depends(authorize_delete)
+	# Autentica e autoriza 'delete' em um único nó de dependência
+	user: UserToken = Depends(authorize_delete)
 ):
 	"""
 	Executa um DeleteItem no DynamoDB APENAS se o usuário tiver permissão '{tabela}:delete'.
@@ -320,12 +588,16 @@ async def delete_item_proxy(
 		key_value (str): Valor da chave primária a ser deletada.
 	"""
 	try:
-		table = dynamodb.Table(table_name)
+		table = await get_table(table_name)
 		
 		# DynamoDB deleta com base na chave principal
 		Key = {key: key_value}
-		table.delete_item(Key=Key)
-		
+		await table.delete_item(Key=Key)
+
+		# Deleções na tabela 'roles' invalidam o cache do papel removido
+		if table_name == 'roles':
+			invalidate_role_cache(key_value if key == 'role_name' else None)
+
 		return {"message": f"Item deletado com sucesso da tabela {table_name}"}
 
 	except ClientError as e:
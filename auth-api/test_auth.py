@@ -1,3 +1,6 @@
+import asyncio
+import os
+
 import httpx
 import pytest
 
@@ -18,188 +21,168 @@ USERS = {
 @pytest.fixture(scope="session")
 def tokens():
 	"""
-	Fixture que realiza o login para todos os usuários definidos em USERS 
+	Fixture que realiza o login para todos os usuários definidos em USERS
 	e armazena seus tokens JWT para uso em todos os testes da sessão.
-	
+
+	Os logins são disparados em paralelo com httpx.AsyncClient + asyncio.gather,
+	então o setup custa ~1 ida à API em vez de uma por usuário.
+
 	Returns:
 		dict: Um dicionário onde a chave é o papel ('reader', 'writer', 'admin') e o valor é o token JWT.
 	"""
+	async def _login_all():
+		async with httpx.AsyncClient() as client:
+			# Usa 'json=' para enviar o corpo JSON, correspondendo ao modelo Pydantic UserLogin da API
+			return await asyncio.gather(*[
+				client.post(LOGIN_URL, json={"username": creds["username"], "password": creds["password"]})
+				for creds in USERS.values()
+			])
+
 	user_tokens = {}
-	for role, creds in USERS.items():
-		# Usa httpx para enviar a requisição POST de login
-		response = httpx.post(
-			LOGIN_URL, 
-			# Usa 'json=' para enviar o corpo JSON, correspondendo ao modelo Pydantic UserLogin da APIjson={"username": creds["username"], "password": creds["password"]} 
-			json={"username": creds["username"], "password": creds["password"]}
-		)
-			
+	for role, response in zip(USERS, asyncio.run(_login_all())):
 		response.raise_for_status() # Levanta exceção para status 4xx (client side) ou 5xx (server side)
-		token_data = response.json()
-		user_tokens[role] = token_data["access_token"]
+		user_tokens[role] = response.json()["access_token"]
 	return user_tokens
 
+# Nome do item de teste, único por worker do pytest-xdist: execuções paralelas
+# não disputam o mesmo item (em execução sequencial vira 'TestUser-master')
+TEST_ITEM_NAME = f"TestUser-{os.getenv('PYTEST_XDIST_WORKER', 'master')}"
+
+def _case(role, method, status_code, table):
+	"""
+	Empacota um caso parametrizado no grupo xdist do seu papel, com id explícito.
+
+	O id curto 'papel-método-tabela' dispensa a geração automática de ids do
+	pytest (que serializa todos os parâmetros na coleta). Com
+	'pytest -n auto --dist loadgroup', todos os casos de um papel vão para
+	o mesmo worker, na ordem declarada — necessário porque a sequência
+	POST/GET/DELETE de cada papel depende do estado deixado pelo caso anterior.
+	"""
+	return pytest.param(
+		role, method, status_code, table,
+		id=f"{role}-{method}-{table}",
+		marks=pytest.mark.xdist_group(role)
+	)
+
+@pytest.fixture(scope="session")
+def http_client():
+	"""
+	Cliente httpx único para toda a sessão de testes.
+
+	Reaproveita o mesmo pool de conexões em todos os casos parametrizados, em
+	vez de pagar a criação de cliente + handshake TCP em cada teste.
+	"""
+	with httpx.Client(timeout=5) as client:
+		yield client
+
 # Dados de teste para POST/PUT
 DUMMY_DATA = {
-	"key": {"customer_name": "TestUser"},
+	"key": {"customer_name": TEST_ITEM_NAME},
 	"attributes": {"customer_street": "TestStreet", "customer_city":"TestCity"},
 }
 
 
-@pytest.fixture(scope="module", autouse=True)
-def setup_test_item(tokens):
-	""" 
-	Fixture que garante que o item de teste 'TestUser' exista antes de executar 
-	os testes do módulo e o remove após a conclusão (limpeza/teardown).
-	
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_item(tokens, http_client):
+	"""
+	Fixture que garante que o item de teste exista antes de executar os testes
+	e o remove ao final da sessão (limpeza/teardown). Escopo de sessão: o item
+	é criado e removido uma única vez, não uma vez por módulo.
+
 	Args:
 		tokens (dict): Fixture contendo os tokens JWT.
-	
+		http_client (httpx.Client): Cliente compartilhado da sessão.
+
 	Yields:
 		None: Executa os testes entre o SETUP e o TEARDOWN.
 	"""
-	admin_token = tokens["admin"] 
+	admin_token = tokens["admin"]
 	headers = {"Authorization": f"Bearer {admin_token}"}
 	url = f"{BASE_URL}/api/{TEST_TABLE}/item"
-	
+
 	# SETUP: Cria o item para que os GETs e DELETEs subsequentes funcionem
 	print("\n[SETUP] Criando item de teste (TestUser)...")
-	
+
 	# Tenta criar (POST) o item usando o token de Admin
-	response_post = httpx.post(url, json=DUMMY_DATA, headers=headers)
-	
+	response_post = http_client.post(url, json=DUMMY_DATA, headers=headers)
+
 	if response_post.status_code not in [200, 201]:
 		print(f"[AVISO] Falha ao criar item de teste. Status: {response_post.status_code}. Detalhe: {response_post.text}")
-		
+
 	# Executa todos os testes do módulo
 	yield
-	
+
 	# TEARDOWN: Remove o item após a execução de todos os testes
 	print("\n[TEARDOWN] Removendo item de teste (TestUser)...")
-	
+
 	# Delete usa parâmetros de query para a chave
-	params_delete = {"key": "customer_name", "key_value": "TestUser"}
-	response_delete = httpx.delete(url, params=params_delete, headers=headers)
+	params_delete = {"key": "customer_name", "key_value": TEST_ITEM_NAME}
+	response_delete = http_client.delete(url, params=params_delete, headers=headers)
 	
 	if response_delete.status_code not in [200, 204]:
 		print(f"[AVISO] Falha ao remover item de teste. Status: {response_delete.status_code}. Detalhe: {response_delete.text}")
 	else:
 		print("[TEARDOWN] Limpeza concluída.")
 
-@pytest.mark.parametrize("role, method, status_code", [
-	# 1. Testes do Papel READER (Deve ter acesso de leitura na tabela customer)("reader", "PUT", 403),
-	("reader", "POST", 403),
-	("reader", "PUT", 403),
-	("reader", "GET", 200),
-	("reader", "DELETE", 403),
-
-	# 2. Testes do Papel WRITER (Deve ter acesso total na tabela customer)
-	("writer", "POST", 200),
-	("writer", "PUT", 200),
-	("writer", "GET", 200),
-	("writer", "DELETE", 200),
-
-	# 3. Testes do Papel ADMIN (Acesso total via Coringa '*')
-	("admin", "POST", 200),
-	("admin", "PUT", 200),
-	("admin", "GET", 200),
-	("admin", "DELETE", 200),
-])
-def test_authorization_matrix(tokens, role, method, status_code):
+# Payloads de requisição por (tabela, tipo), incluindo as tabelas sensíveis:
+# 'POST' é o corpo JSON de POST/PUT e 'GET_KEY' são os query params de
+# GET/DELETE. Dict plano com chave em tupla: uma única busca por caso.
+REQUEST_DATA = {
+	(TEST_TABLE, "POST"): DUMMY_DATA,
+	(TEST_TABLE, "GET_KEY"): {"key": "customer_name", "key_value": TEST_ITEM_NAME},
+	("users", "POST"): {"key": {"username": "TestSensitiveUser"}, "attributes": {"password_hash": "...", "role": ["reader"]}},
+	("users", "GET_KEY"): {"key": "username", "key_value": "TestSensitiveUser"},
+	("roles", "POST"): {"key": {"role_name": "TestSensitiveRole"}, "attributes": {"permissions": ["table:read"]}},
+	("roles", "GET_KEY"): {"key": "role_name", "key_value": "TestSensitiveRole"},
+}
+
+# Métodos na ordem POST, PUT, GET, DELETE: cada papel cria o estado que os
+# casos seguintes do próprio grupo consomem
+_METHODS = ("POST", "PUT", "GET", "DELETE")
+
+# Métodos permitidos por papel e tabela — única fonte de verdade da matriz.
+# Reader só lê a tabela de dados; Writer tem acesso total a ela; apenas o
+# Admin (coringa '*') alcança as tabelas sensíveis 'users' e 'roles'.
+_ALLOWED = {
+	"reader": {TEST_TABLE: ("GET",)},
+	"writer": {TEST_TABLE: _METHODS},
+	"admin": {TEST_TABLE: _METHODS, "users": _METHODS, "roles": _METHODS},
+}
+
+# Matriz completa (papéis × tabelas × métodos, 36 casos) gerada de _ALLOWED,
+# em vez de 36 tuplas literais duplicando a mesma informação
+AUTHORIZATION_CASES = [
+	_case(role, method, 200 if method in allowed.get(table, ()) else 403, table)
+	for role, allowed in _ALLOWED.items()
+	for table in (TEST_TABLE, "users", "roles")
+	for method in _METHODS
+]
+
+@pytest.mark.parametrize("role, method, status_code, table", AUTHORIZATION_CASES)
+def test_authorization(tokens, http_client, role, method, status_code, table):
 	""" 
-	Testa se cada papel de usuário recebe o status code esperado para cada método 
-	HTTP crude na tabela de teste padrão ('customer').
+	Matriz única de autorização: papéis × métodos HTTP × tabelas.
+
+	Cobre a tabela de dados padrão ('customer') e as tabelas sensíveis
+	('users' e 'roles'): apenas o ADMIN (coringa '*') acessa as sensíveis,
+	Reader e Writer devem ser negados (403).
 	"""
 	token = tokens[role]
 	headers = {"Authorization": f"Bearer {token}"}
 
-	url = f"{BASE_URL}/api/{TEST_TABLE}/item"
+	url = f"{BASE_URL}/api/{table}/item"
 	data = None
 	params = None
 
 	if method == "GET" or method == "DELETE":
 		# GET e DELETE usam Query Params para a chave do item
-		params = {"key": "customer_name", "key_value": "TestUser"}
+		params = REQUEST_DATA[(table, "GET_KEY")]
 	elif method == "POST" or method == "PUT":
 		# POST e PUT usam corpo JSON
-		data = DUMMY_DATA
-	
-	# Executa a requisição
-	with httpx.Client(headers=headers, timeout=5) as client:
-		response = client.request(method, url, json=data, params=params)
+		data = REQUEST_DATA[(table, "POST")]
 
-	assert response.status_code == status_code
-	
-# Dados de teste para tabelas sensíveis (users e roles)
-SENSITIVE_DATA = {
-	"users": {
-		"POST": {"key": {"username": "TestSensitiveUser"}, "attributes": {"password_hash": "...", "role": ["reader"]}},
-		"GET_KEY": {"key": "username", "key_value": "TestSensitiveUser"}
-	},
-	"roles": {
-		"POST": {"key": {"role_name": "TestSensitiveRole"}, "attributes": {"permissions": ["table:read"]}},
-		"GET_KEY": {"key": "role_name", "key_value": "TestSensitiveRole"}
-	}
-}
-
-@pytest.mark.parametrize("role, method, status_code, table", [
-	# Reader em Tabelas Sensíveis (DEVE ser negado, 403)
-	("reader", "POST", 403, "users"),
-	("reader", "PUT", 403, "users"),
-	("reader", "GET", 403, "users"),
-	("reader", "DELETE", 403, "users"),
-	##
-	("reader", "POST", 403, "roles"),
-	("reader", "PUT", 403, "roles"),
-	("reader", "GET", 403, "roles"),
-	("reader", "DELETE", 403, "roles"),
-
-	# Writer em Tabelas Sensíveis (DEVE ser negado, 403)
-	("writer", "POST", 403, "users"),
-	("writer", "PUT", 403, "users"),
-	("writer", "GET", 403, "users"),
-	("writer", "DELETE", 403, "users"),
-	##
-	("writer", "POST", 403, "roles"),
-	("writer", "PUT", 403, "roles"),
-	("writer", "GET", 403, "roles"),
-	("writer", "DELETE", 403, "roles"),
-
-	# Admin em Tabelas Sensíveis (DEVE ser permitido, 200)
-	("admin", "POST", 200, "users"),
-	("admin", "PUT", 200, "users"),
-	("admin", "GET", 200, "users"),
-	("admin", "DELETE", 200, "users"),
-	##
-	("admin", "POST", 200, "roles"),
-	("admin", "PUT", 200, "roles"),
-	("admin", "GET", 200, "roles"),
-	("admin", "DELETE", 200, "roles"),
-])
-def test_sensitive_table_access(tokens, role, method, status_code, table):
-	""" 
-	Testa se apenas o ADMIN (que tem o coringa '*') pode acessar as tabelas 
-	sensíveis 'users' e 'roles', confirmando que Reader e Writer são negados (403).
-	"""
-	token = tokens[role]
-	headers = {"Authorization": f"Bearer {token}"}
-	
-	# URL aponta para a tabela sensível
-	url = f"{BASE_URL}/api/{table}/item"
-	data = None
-	params = None
-	
-	# Configura dados/parâmetros baseados no método e na tabela
-	if method == "POST" or method == "PUT":
-		# Usa o payload de POST/PUT do SENSITIVE_DATA
-		data = SENSITIVE_DATA[table]["POST"]
-
-	elif method == "GET" or method == "DELETE":
-		# Usa os Query Params corretos para cada tabela
-		params = SENSITIVE_DATA[table]["GET_KEY"]
-		
-	with httpx.Client(headers=headers, timeout=5) as client:
-		response = client.request(method, url, json=data, params=params)
+	# Executa a requisição no cliente compartilhado da sessão
+	response = http_client.request(method, url, json=data, params=params, headers=headers)
 
 	assert response.status_code == status_code, \
 		f"Falha: Papel {role} com {method} na tabela '{table}' retornou {response.status_code}, esperado {status_code}. Detalhe: {response.text}"
-